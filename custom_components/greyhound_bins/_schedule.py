@@ -0,0 +1,14 @@
+"""Collection schedule maths for the Greyhound Bins integration."""
+from __future__ import annotations
+
+from .const import COLLECTION_INTERVAL_DAYS
+
+
+def next_collection_ordinal(today: int, reference: int) -> int:
+    """Return the ordinal of the first collection on or after today."""
+    # Ceiling division: round up to the next whole cycle unless today is a
+    # collection day, in a single floor division. Before the reference date
+    # the cycle count is not positive, so clamping it to 0 gives the reference.
+    cycles = max(0, -((reference - today) // COLLECTION_INTERVAL_DAYS))
+    return reference + cycles * COLLECTION_INTERVAL_DAYS
+
@@ -1,10 +1,12 @@
 """Constants for the Greyhound Bins integration."""
-from datetime import datetime
 
 DOMAIN = "greyhound_bins"
 
-# Reference date: Black bin on Thursday 1st Jan 2026
-BLACK_BIN_REFERENCE_DATE = datetime(2026, 1, 1, 0, 0, 0)
+# Reference date: Black bin on Thursday 1st Jan 2026, as a proleptic
+# Gregorian ordinal so scheduling is int maths
+BLACK_REF_ORDINAL = 739617  # date(2026, 1, 1).toordinal()
+# Green & Brown bins start one week after black bin
+GREEN_REF_ORDINAL = BLACK_REF_ORDINAL + 7
 
 # Bin types
 BIN_TYPE_BLACK = "black"
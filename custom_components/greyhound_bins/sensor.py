@@ -1,25 +1,104 @@
 """Sensor platform for Greyhound Bins integration."""
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+from datetime import date, datetime
 import logging
+from typing import Any
 
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import (
+    async_dispatcher_connect,
+    async_dispatcher_send,
+)
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_track_time_change
 from homeassistant.util import dt as dt_util
 
+from ._schedule import next_collection_ordinal
 from .const import (
     DOMAIN,
-    BLACK_BIN_REFERENCE_DATE,
+    BLACK_REF_ORDINAL,
+    GREEN_REF_ORDINAL,
     BIN_TYPE_BLACK,
     BIN_TYPE_GREEN_BROWN,
-    COLLECTION_INTERVAL_DAYS,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+_BIN_NAMES = {
+    BIN_TYPE_BLACK: "Black Bin",
+    BIN_TYPE_GREEN_BROWN: "Green & Brown Bins",
+}
+_BIN_ICONS = {
+    BIN_TYPE_BLACK: "mdi:delete",
+    BIN_TYPE_GREEN_BROWN: "mdi:recycle",
+}
+_SENSOR_NAMES = {
+    BIN_TYPE_BLACK: "Greyhound Black Bin Collection",
+    BIN_TYPE_GREEN_BROWN: "Greyhound Green & Brown Bins Collection",
+}
+_SENSOR_UNIQUE_IDS = {
+    BIN_TYPE_BLACK: "greyhound_bins_black",
+    BIN_TYPE_GREEN_BROWN: "greyhound_bins_green_brown",
+}
+# English names so the state does not depend on the host's locale
+_WEEKDAY_NAMES = (
+    "Monday",
+    "Tuesday",
+    "Wednesday",
+    "Thursday",
+    "Friday",
+    "Saturday",
+    "Sunday",
+)
+_MONTH_NAMES = (
+    "",
+    "January",
+    "February",
+    "March",
+    "April",
+    "May",
+    "June",
+    "July",
+    "August",
+    "September",
+    "October",
+    "November",
+    "December",
+)
+_BIN_REFERENCES = {
+    BIN_TYPE_BLACK: BLACK_REF_ORDINAL,
+    BIN_TYPE_GREEN_BROWN: GREEN_REF_ORDINAL,
+}
+
+
+def _refresh_schedule(schedule: dict[str, int], today: int) -> None:
+    """Compute today's next collection ordinal for both bin types at once."""
+    schedule["today"] = today
+    for bin_type, reference in _BIN_REFERENCES.items():
+        schedule[bin_type] = next_collection_ordinal(today, reference)
+
+
+def _format_collection(next_collection: int, today: int) -> tuple[str, dict[str, Any]]:
+    """Return the state string and attributes for a collection ordinal."""
+    collection_date = date.fromordinal(next_collection)
+    collection_day = _WEEKDAY_NAMES[collection_date.weekday()]
+    days_until = next_collection - today
+
+    state = (
+        f"{collection_day}, {collection_date.day:02d} "
+        f"{_MONTH_NAMES[collection_date.month]} {collection_date.year}"
+    )
+    return state, {
+        "days_until_collection": days_until,
+        "collection_date": collection_date.isoformat(),
+        "collection_day": collection_day,
+        "is_tomorrow": days_until == 1,
+        "is_today": days_until == 0,
+    }
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -27,162 +106,122 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Greyhound Bins sensors."""
-    sensors = [
-        GreyhoundBinSensor(BIN_TYPE_BLACK, "Black Bin"),
-        GreyhoundBinSensor(BIN_TYPE_GREEN_BROWN, "Green & Brown Bins"),
-        NextCollectionSensor(),
-    ]
-    
+    # Shared by all sensors so the schedule is only worked out once per day
+    schedule: dict[str, int] = {}
+    _refresh_schedule(schedule, dt_util.now().toordinal())
+    signal = f"{DOMAIN}_{entry.entry_id}_new_day"
+
+    sensors = (
+        GreyhoundBinSensor(schedule, signal, BIN_TYPE_BLACK),
+        GreyhoundBinSensor(schedule, signal, BIN_TYPE_GREEN_BROWN),
+        NextCollectionSensor(schedule, signal),
+    )
+
+    @callback
+    def _async_new_day(now: datetime) -> None:
+        """Move the schedule on to today and tell the added sensors."""
+        _refresh_schedule(schedule, now.toordinal())
+        async_dispatcher_send(hass, signal)
+
+    entry.async_on_unload(
+        async_track_time_change(hass, _async_new_day, hour=0, minute=0, second=5)
+    )
+
+    # Polling is disabled, so fetch the initial state before adding
     async_add_entities(sensors, True)
 
 
-class GreyhoundBinSensor(SensorEntity):
-    """Representation of a Greyhound Bin collection sensor."""
+class _GreyhoundCollectionSensor(SensorEntity):
+    """Base for sensors that read the shared schedule once a day."""
+
+    __slots__ = (
+        "_schedule",
+        "_signal",
+        "_bin_type",
+        "_fmt_long",
+        "_cached_attrs",
+    )
+
+    _attr_should_poll = False
 
-    def __init__(self, bin_type: str, name: str) -> None:
+    def __init__(self, schedule: dict[str, int], signal: str) -> None:
         """Initialize the sensor."""
-        self._bin_type = bin_type
-        self._attr_name = f"Greyhound {name} Collection"
-        self._attr_unique_id = f"greyhound_bins_{bin_type}"
-        self._attr_icon = "mdi:delete" if bin_type == BIN_TYPE_BLACK else "mdi:recycle"
-        self._next_collection = None
-        self._days_until = None
+        self._schedule = schedule
+        self._signal = signal
+        self._fmt_long = None
+        self._cached_attrs = {}
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to the daily schedule refresh."""
+        self.async_on_remove(
+            async_dispatcher_connect(self.hass, self._signal, self._async_new_day)
+        )
+
+    @callback
+    def _async_new_day(self) -> None:
+        """Update from the refreshed schedule."""
+        self.async_schedule_update_ha_state(True)
 
     @property
     def native_value(self) -> str | None:
         """Return the state of the sensor."""
-        if self._next_collection:
-            return self._next_collection.strftime("%A, %d %B %Y")
-        return None
+        return self._fmt_long
 
     @property
     def extra_state_attributes(self) -> dict[str, any]:
         """Return additional attributes."""
-        if not self._next_collection:
-            return {}
-        
-        return {
-            "days_until_collection": self._days_until,
-            "collection_date": self._next_collection.strftime("%Y-%m-%d"),
-            "collection_day": self._next_collection.strftime("%A"),
-            "is_tomorrow": self._days_until == 1,
-            "is_today": self._days_until == 0,
-        }
-
-    def _calculate_next_collection(self) -> datetime:
-        """Calculate the next collection date for this bin type."""
-        now_dt = dt_util.now()
-        now_date = now_dt.date()
-        
-        # Reference date: Thursday 1st Jan 2026
-        reference_date = BLACK_BIN_REFERENCE_DATE.date()
-        
-        # Calculate offset from reference date
-        if self._bin_type == BIN_TYPE_BLACK:
-            reference = reference_date
-        else:
-            # Green & Brown bins start one week after black bin
-            reference = reference_date + timedelta(days=7)
-        
-        # Find the next collection date
-        days_since_reference = (now_date - reference).days
-        
-        if days_since_reference < 0:
-            next_collection_date = reference
-        else:
-            # Calculate how many collection cycles have passed
-            cycles_passed = days_since_reference // COLLECTION_INTERVAL_DAYS
-            
-            # Calculate the potential collection date
-            next_collection_date = reference + timedelta(days=(cycles_passed * COLLECTION_INTERVAL_DAYS))
-            
-            # If that date is in the past, move to the next cycle
-            if next_collection_date < now_date:
-                next_collection_date = reference + timedelta(days=((cycles_passed + 1) * COLLECTION_INTERVAL_DAYS))
-        
-        # Convert back to a datetime at midnight for the state
-        return datetime.combine(next_collection_date, datetime.min.time())
+        return self._cached_attrs
+
+
+class GreyhoundBinSensor(_GreyhoundCollectionSensor):
+    """Representation of a Greyhound Bin collection sensor."""
+
+    def __init__(self, schedule: dict[str, int], signal: str, bin_type: str) -> None:
+        """Initialize the sensor."""
+        super().__init__(schedule, signal)
+        self._bin_type = bin_type
+        self._attr_name = _SENSOR_NAMES[bin_type]
+        self._attr_unique_id = _SENSOR_UNIQUE_IDS[bin_type]
+        self._attr_icon = _BIN_ICONS[bin_type]
 
     async def async_update(self) -> None:
         """Update the sensor."""
-        self._next_collection = self._calculate_next_collection()
-        now_date = dt_util.now().date()
-        self._days_until = (self._next_collection.date() - now_date).days
+        next_collection = self._schedule[self._bin_type]
+
+        # Format once per update rather than on every state/attribute read
+        self._fmt_long, self._cached_attrs = _format_collection(
+            next_collection, self._schedule["today"]
+        )
 
 
-class NextCollectionSensor(SensorEntity):
+class NextCollectionSensor(_GreyhoundCollectionSensor):
     """Sensor showing the next bin collection regardless of type."""
 
-    def __init__(self) -> None:
+    def __init__(self, schedule: dict[str, int], signal: str) -> None:
         """Initialize the sensor."""
+        super().__init__(schedule, signal)
         self._attr_name = "Greyhound Next Bin Collection"
         self._attr_unique_id = "greyhound_bins_next_collection"
         self._attr_icon = "mdi:calendar-clock"
-        self._next_collection = None
         self._bin_type = None
-        self._days_until = None
 
-    @property
-    def native_value(self) -> str | None:
-        """Return the state of the sensor."""
-        if self._next_collection:
-            return self._next_collection.strftime("%A, %d %B %Y")
-        return None
+    def _sooner_collection(self) -> tuple[int, str]:
+        """Return the sooner scheduled collection ordinal and its bin type."""
+        next_black = self._schedule[BIN_TYPE_BLACK]
+        next_green_brown = self._schedule[BIN_TYPE_GREEN_BROWN]
 
-    @property
-    def extra_state_attributes(self) -> dict[str, any]:
-        """Return additional attributes."""
-        if not self._next_collection:
-            return {}
-        
-        bin_name = "Black Bin" if self._bin_type == BIN_TYPE_BLACK else "Green & Brown Bins"
-        
-        return {
-            "bin_type": bin_name,
-            "days_until_collection": self._days_until,
-            "collection_date": self._next_collection.strftime("%Y-%m-%d"),
-            "collection_day": self._next_collection.strftime("%A"),
-            "is_tomorrow": self._days_until == 1,
-            "is_today": self._days_until == 0,
-        }
-
-    def _calculate_next_collection(self) -> tuple[datetime, str]:
-        """Calculate the next collection date (either bin type)."""
-        now_date = dt_util.now().date()
-        reference_date = BLACK_BIN_REFERENCE_DATE.date()
-        
-        # Calculate next black bin collection
-        black_reference = reference_date
-        days_since_black = (now_date - black_reference).days
-        
-        if days_since_black < 0:
-            next_black = black_reference
-        else:
-            cycles_passed = days_since_black // COLLECTION_INTERVAL_DAYS
-            next_black = black_reference + timedelta(days=(cycles_passed * COLLECTION_INTERVAL_DAYS))
-            if next_black < now_date:
-                next_black = black_reference + timedelta(days=((cycles_passed + 1) * COLLECTION_INTERVAL_DAYS))
-        
-        # Calculate next green & brown bin collection
-        green_brown_reference = reference_date + timedelta(days=7)
-        days_since_green = (now_date - green_brown_reference).days
-        
-        if days_since_green < 0:
-            next_green_brown = green_brown_reference
-        else:
-            cycles_passed = days_since_green // COLLECTION_INTERVAL_DAYS
-            next_green_brown = green_brown_reference + timedelta(days=(cycles_passed * COLLECTION_INTERVAL_DAYS))
-            if next_green_brown < now_date:
-                next_green_brown = green_brown_reference + timedelta(days=((cycles_passed + 1) * COLLECTION_INTERVAL_DAYS))
-        
         # Return whichever is sooner
         if next_black <= next_green_brown:
-            return datetime.combine(next_black, datetime.min.time()), BIN_TYPE_BLACK
+            return next_black, BIN_TYPE_BLACK
         else:
-            return datetime.combine(next_green_brown, datetime.min.time()), BIN_TYPE_GREEN_BROWN
+            return next_green_brown, BIN_TYPE_GREEN_BROWN
 
     async def async_update(self) -> None:
         """Update the sensor."""
-        self._next_collection, self._bin_type = self._calculate_next_collection()
-        now_date = dt_util.now().date()
-        self._days_until = (self._next_collection.date() - now_date).days
+        next_collection, self._bin_type = self._sooner_collection()
+
+        # Format once per update rather than on every state/attribute read
+        self._fmt_long, attributes = _format_collection(
+            next_collection, self._schedule["today"]
+        )
+        self._cached_attrs = {"bin_type": _BIN_NAMES[self._bin_type], **attributes}
@@ -0,0 +1,85 @@
+"""Tests for the Greyhound Bins collection schedule maths."""
+from __future__ import annotations
+
+from datetime import date, timedelta
+
+import pytest
+
+from custom_components.greyhound_bins._schedule import next_collection_ordinal
+from custom_components.greyhound_bins.const import (
+    BLACK_REF_ORDINAL,
+    GREEN_REF_ORDINAL,
+)
+
+BLACK_REFERENCE = date(2026, 1, 1)
+GREEN_REFERENCE = date(2026, 1, 8)
+
+
+def _baseline_next_collection(today: date, reference: date) -> date:
+    """Original timedelta-based calculation the integration shipped with."""
+    days_since_reference = (today - reference).days
+    if days_since_reference < 0:
+        return reference
+    cycles_passed = days_since_reference // 14
+    next_collection = reference + timedelta(days=cycles_passed * 14)
+    if next_collection < today:
+        next_collection = reference + timedelta(days=(cycles_passed + 1) * 14)
+    return next_collection
+
+
+def test_reference_ordinals() -> None:
+    """The reference ordinals are the first black and green/brown Thursdays."""
+    assert date.fromordinal(BLACK_REF_ORDINAL) == BLACK_REFERENCE
+    assert date.fromordinal(GREEN_REF_ORDINAL) == GREEN_REFERENCE
+    assert BLACK_REFERENCE.weekday() == GREEN_REFERENCE.weekday() == 3
+
+
+@pytest.mark.parametrize(
+    ("today", "reference", "expected"),
+    [
+        # Collection day itself counts, so is_today can be true
+        (date(2026, 1, 1), BLACK_REFERENCE, date(2026, 1, 1)),
+        (date(2026, 1, 15), BLACK_REFERENCE, date(2026, 1, 15)),
+        (date(2026, 1, 22), GREEN_REFERENCE, date(2026, 1, 22)),
+        # The day after a collection moves on a full cycle
+        (date(2026, 1, 2), BLACK_REFERENCE, date(2026, 1, 15)),
+        (date(2026, 1, 9), GREEN_REFERENCE, date(2026, 1, 22)),
+        # Before the reference date the reference itself is next
+        (date(2025, 12, 1), BLACK_REFERENCE, date(2026, 1, 1)),
+        (date(2025, 12, 31), BLACK_REFERENCE, date(2026, 1, 1)),
+        (date(2026, 1, 1), GREEN_REFERENCE, date(2026, 1, 8)),
+        (date(2025, 6, 1), GREEN_REFERENCE, date(2026, 1, 8)),
+    ],
+)
+def test_next_collection_ordinal(
+    today: date, reference: date, expected: date
+) -> None:
+    """Known dates around collection days and the reference date."""
+    assert (
+        next_collection_ordinal(today.toordinal(), reference.toordinal())
+        == expected.toordinal()
+    )
+
+
+def test_next_collection_ordinal_matches_baseline() -> None:
+    """Every day from before the reference matches the original calculation."""
+    for offset in range(-60, 800):
+        today = BLACK_REFERENCE + timedelta(days=offset)
+        for reference in (BLACK_REFERENCE, GREEN_REFERENCE):
+            expected = _baseline_next_collection(today, reference)
+            assert next_collection_ordinal(
+                today.toordinal(), reference.toordinal()
+            ) == expected.toordinal(), (today, reference)
+
+
+def test_black_and_green_brown_alternate() -> None:
+    """There is a collection every Thursday, alternating between the bins."""
+    for offset in range(0, 800):
+        today = BLACK_REFERENCE.toordinal() + offset
+        black = next_collection_ordinal(today, BLACK_REF_ORDINAL)
+        green_brown = next_collection_ordinal(today, GREEN_REF_ORDINAL)
+
+        assert abs(black - green_brown) == 7
+        sooner = date.fromordinal(min(black, green_brown))
+        assert sooner.weekday() == 3
+        assert 0 <= sooner.toordinal() - today <= 6